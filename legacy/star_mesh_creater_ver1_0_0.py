@@ -1,7 +1,8 @@
 import bpy
-import bmesh
 import math
 
+import numpy as np
+
 bl_info = {
     "name": "サンプルアドオン：Star Adder",
     "version": (1, 0, 0),
@@ -55,27 +56,19 @@ class SAMPLE_OT_CreateStarPolygon(bpy.types.Operator):
         bpy.context.view_layer.objects.active = new_obj
         new_obj.select_set(True)
         
-        # bmeshで星の形状を作成
-        bm = bmesh.new()
-        verts = []
-        dtheta = 2.0 * math.pi / num_sides
+        # 外側/内側の頂点を交互に並べた座標を NumPy でまとめて計算
+        count = num_sides * 2
+        idx = np.arange(count)
+        angles = idx * (math.pi / num_sides)  # 半ステップ(dtheta/2)刻み
+        radii = np.where(idx % 2 == 0, radius, radius / 2)
         
-        for i in range(num_sides):
-            # 外側の頂点
-            outer_x = radius * math.cos(i * dtheta)
-            outer_y = radius * math.sin(i * dtheta)
-            outer_vert = bm.verts.new([outer_x, outer_y, 0.0])
-            verts.append(outer_vert)
-            
-            # 内側の頂点
-            inner_x = (radius / 2) * math.cos(i * dtheta + dtheta / 2)
-            inner_y = (radius / 2) * math.sin(i * dtheta + dtheta / 2)
-            inner_vert = bm.verts.new([inner_x, inner_y, 0.0])
-            verts.append(inner_vert)
+        coords = np.zeros((count, 3))
+        coords[:, 0] = np.cos(angles) * radii
+        coords[:, 1] = np.sin(angles) * radii
         
-        bm.faces.new(verts)
-        bm.to_mesh(new_mesh)
-        bm.free()  # メモリ解放
+        # 1枚のNゴン面として一括でメッシュを作成（bmeshは使わない）
+        new_mesh.from_pydata(coords.tolist(), [], [list(range(count))])
+        new_mesh.update()
         
         print("オペレータを実行しました")
         return {'FINISHED'}
@@ -10,10 +10,12 @@ bl_info = {
 }
 
 import bpy
-import bmesh
 import math
 import json
 import time
+from functools import lru_cache
+
+import numpy as np
 
 from bpy.props import (
     BoolProperty,
@@ -24,6 +26,8 @@ from bpy.props import (
     StringProperty,
 )
 
+from bpy.app.handlers import persistent
+
 import gpu
 from gpu_extras.batch import batch_for_shader
 import blf
@@ -33,7 +37,14 @@ import blf
 # Presets stored in Scene Collection (root)
 # ============================================================
 
-_PRESET_KEY = "STAR_MESH_CREATOR_PRESETS_JSON"
+# Presets live in a nested ID-property group on the Scene Collection (no serialization).
+# Each preset is one entry of the "presets" list with its name stored as a value:
+# ID-property keys are capped at 63 bytes, preset names are not.
+# The legacy JSON string is never written or deleted here: star_mesh_creator.py (1.0.1)
+# still reads and writes it on the same collection. On load, its presets that the group
+# lacks are merged in (the group wins on name clashes), so both versions stay visible.
+_PRESET_KEY = "STAR_MESH_CREATOR_PRESETS"
+_LEGACY_PRESET_JSON_KEY = "STAR_MESH_CREATOR_PRESETS_JSON"
 _PRESET_SCHEMA_VERSION = 1
 
 
@@ -41,45 +52,144 @@ def _root_collection(context) -> bpy.types.Collection:
     return context.scene.collection
 
 
-def _load_presets(context) -> dict:
-    col = _root_collection(context)
-    raw = col.get(_PRESET_KEY, "")
+# Presets (and their EnumProperty items) keyed by what they were read from:
+# (collection pointer, group revision or None, raw legacy JSON string).
+# _preset_items runs on every UI poll, so only rebuild when that key changes.
+# Holding the items list here also keeps its strings alive, as EnumProperty callbacks require.
+_NO_PRESET_ITEMS = [("NONE", "(no presets)", "No presets available")]
+_preset_cache = {"key": None, "data": None, "items": _NO_PRESET_ITEMS, "coerced": {}}
+
+# Preset keys applied by the create operator, with their value types
+_PRESET_FIELDS = (
+    ("star_type", str),
+    ("spikes", int),
+    ("outer_radius", float),
+    ("inner_radius", float),
+    ("global_scale", float),
+    ("thickness", float),
+)
+
+
+def _normalize_presets(data) -> dict:
+    if not isinstance(data, dict):
+        return {"version": _PRESET_SCHEMA_VERSION, "presets": {}}
+    data.setdefault("version", _PRESET_SCHEMA_VERSION)
+    if "presets" not in data or not isinstance(data["presets"], dict):
+        data["presets"] = {}
+    return data
+
+
+def _parse_legacy_presets(raw: str) -> dict:
     if not raw:
         return {"version": _PRESET_SCHEMA_VERSION, "presets": {}}
     try:
-        data = json.loads(raw)
-        if not isinstance(data, dict):
-            return {"version": _PRESET_SCHEMA_VERSION, "presets": {}}
-        data.setdefault("version", _PRESET_SCHEMA_VERSION)
-        if "presets" not in data or not isinstance(data["presets"], dict):
-            data["presets"] = {}
-        return data
+        return _normalize_presets(json.loads(raw))
     except Exception:
         return {"version": _PRESET_SCHEMA_VERSION, "presets": {}}
 
 
-def _save_presets(context, data: dict) -> None:
-    col = _root_collection(context)
-    col[_PRESET_KEY] = json.dumps(data, ensure_ascii=False, indent=2)
+def _presets_from_group(stored: dict) -> dict:
+    # Stored list of {"name": ..., params} -> in-memory {"version", "presets": {name: params}}
+    presets = {}
+    entries = stored.get("presets")
+    if isinstance(entries, list):
+        for entry in entries:
+            if not isinstance(entry, dict):
+                continue
+            name = entry.get("name")
+            if isinstance(name, str) and name:
+                presets[name] = {k: v for k, v in entry.items() if k != "name"}
+    return {"version": stored.get("version", _PRESET_SCHEMA_VERSION), "presets": presets}
 
 
-def _preset_items(self, context):
-    if not context or not context.scene:
-        return [("NONE", "(no presets)", "No presets available")]
-    data = _load_presets(context)
-    names = sorted(list(data.get("presets", {}).keys()))
+def _build_preset_items(data: dict) -> list:
+    names = sorted(data.get("presets", {}).keys())
     if not names:
-        return [("NONE", "(no presets)", "No presets available")]
+        return _NO_PRESET_ITEMS
     items = [("NONE", "(none)", "No preset")]
     for n in names:
         items.append((n, n, f"Preset: {n}"))
     return items
 
 
+def _coerce_presets(data: dict) -> dict:
+    # name -> create params already converted to Python types (missing/invalid keys left out)
+    coerced = {}
+    for name, p in data.get("presets", {}).items():
+        if not isinstance(p, dict):
+            continue
+        params = {}
+        for key, conv in _PRESET_FIELDS:
+            if key in p:
+                try:
+                    params[key] = conv(p[key])
+                except (TypeError, ValueError):
+                    pass
+        coerced[name] = params
+    return coerced
+
+
+def _set_preset_cache(key, data: dict) -> None:
+    _preset_cache["key"] = key
+    _preset_cache["data"] = data
+    _preset_cache["items"] = _build_preset_items(data)
+    _preset_cache["coerced"] = _coerce_presets(data)
+
+
+def _load_presets(context) -> dict:
+    """Return the preset dict (shared cache: do not mutate, build a new dict for saving)."""
+    col = _root_collection(context)
+    group = col.get(_PRESET_KEY)
+    if not hasattr(group, "to_dict"):
+        group = None
+    raw = col.get(_LEGACY_PRESET_JSON_KEY, "")
+    key = (col.as_pointer(), group.get("revision", 0) if group is not None else None, raw)
+    if key != _preset_cache["key"]:
+        legacy = _parse_legacy_presets(raw)
+        if group is None:
+            data = legacy
+        else:
+            data = _presets_from_group(group.to_dict())
+            for name, p in legacy["presets"].items():
+                data["presets"].setdefault(name, p)
+        _set_preset_cache(key, data)
+    return _preset_cache["data"]
+
+
+def _save_presets(context, data: dict) -> None:
+    col = _root_collection(context)
+    prev = col.get(_PRESET_KEY)
+    revision = (prev.get("revision", 0) if hasattr(prev, "get") else 0) + 1
+    col[_PRESET_KEY] = {
+        "version": data.get("version", _PRESET_SCHEMA_VERSION),
+        "revision": revision,
+        "presets": [dict(p, name=n) for n, p in data.get("presets", {}).items() if isinstance(p, dict)],
+    }
+    _set_preset_cache((col.as_pointer(), revision, col.get(_LEGACY_PRESET_JSON_KEY, "")), data)
+
+
+@persistent
+def _on_load_post(_dummy):
+    # Collection pointers can be reused by a newly loaded file
+    _preset_cache["key"] = None
+
+
+def _preset_items(self, context):
+    if not context or not context.scene:
+        return _NO_PRESET_ITEMS
+    col = _root_collection(context)
+    if _PRESET_KEY not in col and _LEGACY_PRESET_JSON_KEY not in col:
+        return _NO_PRESET_ITEMS  # common case: nothing saved in this scene yet
+    _load_presets(context)
+    return _preset_cache["items"]
+
+
 # ============================================================
 # Star mesh building (triangle fan from center -> triangles)
 # ============================================================
 
+_OK = (True, "")
+
 def _validate(star_type: str, spikes: int, outer: float, inner: float, scale: float, thickness: float):
     if spikes < 3:
         return False, "Spikes must be >= 3"
@@ -89,46 +199,127 @@ def _validate(star_type: str, spikes: int, outer: float, inner: float, scale: fl
         return False, "Inner Radius must be smaller than Outer Radius"
     if star_type == "STAR_3D" and thickness < 0.0:
         return False, "Thickness must be >= 0"
-    return True, ""
+    return _OK
 
 
 def _make_name(pattern: str, spikes: int) -> str:
+    if pattern == "Star_##":
+        return f"Star_{spikes:02d}"
     s2 = f"{spikes:02d}"
     name = (pattern or "Star_##").replace("##", s2).replace("{spikes}", str(spikes))
     return name.strip() or f"Star_{s2}"
 
 
-def _build_star_bmesh(bm: bmesh.types.BMesh, spikes: int, outer_r: float, inner_r: float, rot_deg: float):
-    count = spikes * 2
-    step = (2.0 * math.pi) / count
-    rot = math.radians(rot_deg)
+# (spikes, is_prism) of the last full build, stored on the mesh datablock
+_TOPOLOGY_SIG_KEY = "_star_topology_sig"
+# Parameters of the last build (see _build_params), also stored on the mesh datablock:
+# undo and file load restore them together with the geometry they describe
+_BUILD_PARAMS_KEY = "_star_build_params"
 
-    ring = []
-    for i in range(count):
-        ang = i * step + rot
-        r = outer_r if (i % 2 == 0) else inner_r
-        ring.append(bm.verts.new((math.cos(ang) * r, math.sin(ang) * r, 0.0)))
 
-    center = bm.verts.new((0.0, 0.0, 0.0))
-    bm.verts.ensure_lookup_table()
+def _build_params(star_type: str, spikes: int, outer: float, inner: float, scale: float, thickness: float, rot_deg: float) -> tuple:
+    # all floats so it round-trips through a float ID-property array
+    return (float(star_type == "STAR_3D"), float(spikes), outer, inner, scale, thickness, rot_deg)
 
-    for i in range(count):
-        v0 = ring[i]
-        v1 = ring[(i + 1) % count]
-        bm.faces.new((center, v0, v1))
 
-    bm.faces.ensure_lookup_table()
-    bmesh.ops.recalc_face_normals(bm, faces=bm.faces)
+def _mesh_is_built(obj: bpy.types.Object, op) -> bool:
+    # True when obj's mesh was last built from op's current parameters
+    params = _build_params(
+        op.star_type, op.spikes, op.outer_radius, op.inner_radius, op.global_scale, op.thickness, op.rotation_deg,
+    )
+    return tuple(obj.data.get(_BUILD_PARAMS_KEY, ())) == params
 
 
-def _extrude_thickness(bm: bmesh.types.BMesh, thickness: float):
-    if thickness <= 0.0:
-        return
-    bm.faces.ensure_lookup_table()
-    res = bmesh.ops.extrude_face_region(bm, geom=list(bm.faces))
-    extruded_verts = [e for e in res["geom"] if isinstance(e, bmesh.types.BMVert)]
-    bmesh.ops.translate(bm, verts=extruded_verts, vec=(0.0, 0.0, thickness))
-    bmesh.ops.recalc_face_normals(bm, faces=bm.faces)
+def _star_ring_coords(spikes: int, outer_r: float, inner_r: float, rot_deg: float) -> np.ndarray:
+    # Alternating outer/inner ring, (count, 3) with z = 0
+    count = spikes * 2
+    step = (2.0 * math.pi) / count
+    idx = np.arange(count)
+    angles = idx * step + math.radians(rot_deg)
+    radii = np.where((idx & 1) == 0, outer_r, inner_r)
+
+    coords = np.empty((count, 3), dtype=np.float64)
+    coords[:, 0] = np.cos(angles) * radii
+    coords[:, 1] = np.sin(angles) * radii
+    coords[:, 2] = 0.0
+    return coords
+
+
+# Reused float32 buffer for vertex uploads (Mesh "co" is float32, so foreach_set is a flat copy)
+_coord_buf = np.empty((0,), dtype=np.float32)
+
+
+def _star_mesh_coords(ring: np.ndarray, thick: float) -> np.ndarray:
+    # Vertex positions in mesh order: ring, center[, top ring, top center].
+    # Returns a view into _coord_buf, valid until the next call.
+    global _coord_buf
+    count = len(ring)
+    layers = 2 if thick > 0.0 else 1
+    n = layers * (count + 1) * 3
+    if _coord_buf.size < n:
+        _coord_buf = np.empty((n,), dtype=np.float32)
+
+    coords = _coord_buf[:n].reshape(-1, 3)
+    coords[:count] = ring
+    coords[count] = 0.0
+    if layers == 2:
+        top = count + 1
+        coords[top:top + count] = ring
+        coords[top:top + count, 2] = thick
+        coords[top + count] = (0.0, 0.0, thick)
+    return coords
+
+
+# (ring size, is_prism) -> (loop vertex indices, loop_start, loop_total); identical for every build with the same key
+_fan_topology_cache = {}
+_FAN_TOPOLOGY_CACHE_MAX = 32
+
+
+def _fan_topology(count: int, prism: bool = False):
+    # Vertex order matches _star_mesh_coords: ring, center[, top ring, top center].
+    # Flat: fan facing +Z. Prism: bottom fan facing -Z, top fan facing +Z,
+    # then one outward quad per ring edge (winding is fixed, no normal recalculation).
+    key = (count, prism)
+    topo = _fan_topology_cache.get(key)
+    if topo is None:
+        i = np.arange(count, dtype=np.int32)
+        j = np.roll(i, -1)
+        center = np.full(count, count, dtype=np.int32)
+        if not prism:
+            loop_vertex_indices = np.stack([center, i, j], axis=1).ravel()
+            loop_total = np.full(count, 3, dtype=np.int32)
+        else:
+            t = count + 1  # first top ring vertex
+            tris = np.concatenate([
+                np.stack([center, j, i], axis=1),
+                np.stack([center + t, t + i, t + j], axis=1),
+            ])
+            quads = np.stack([i, j, t + j, t + i], axis=1)
+            loop_vertex_indices = np.concatenate([tris.ravel(), quads.ravel()])
+            loop_total = np.concatenate([np.full(2 * count, 3, dtype=np.int32), np.full(count, 4, dtype=np.int32)])
+        loop_start = np.zeros(len(loop_total), dtype=np.int32)
+        np.cumsum(loop_total[:-1], out=loop_start[1:])
+        if len(_fan_topology_cache) >= _FAN_TOPOLOGY_CACHE_MAX:
+            _fan_topology_cache.clear()  # scrubbing spikes visits many sizes; keep the cache small
+        topo = _fan_topology_cache[key] = (loop_vertex_indices, loop_start, loop_total)
+    return topo
+
+
+def _write_fan_mesh(mesh: bpy.types.Mesh, coords: np.ndarray, prism: bool = False):
+    # Star fan (or prism) written straight into Mesh arrays (no BMesh)
+    count = (len(coords) // 2 if prism else len(coords)) - 1
+    loop_vertex_indices, loop_start, loop_total = _fan_topology(count, prism)
+
+    mesh.vertices.add(len(coords))
+    mesh.vertices.foreach_set("co", coords.ravel())
+    mesh.loops.add(len(loop_vertex_indices))
+    mesh.loops.foreach_set("vertex_index", loop_vertex_indices)
+    mesh.polygons.add(len(loop_start))
+    mesh.polygons.foreach_set("loop_start", loop_start)
+    if bpy.app.version < (4, 0, 0):
+        # 4.0+ derives loop_total from loop_start (read-only)
+        mesh.polygons.foreach_set("loop_total", loop_total)
+    mesh.update(calc_edges=True)
 
 
 def rebuild_star_mesh(obj: bpy.types.Object, *, star_type: str, spikes: int, outer: float, inner: float, scale: float, thickness: float, rot_deg: float):
@@ -140,16 +331,28 @@ def rebuild_star_mesh(obj: bpy.types.Object, *, star_type: str, spikes: int, out
     inner_r = inner * scale
     thick = thickness * scale
 
-    bm = bmesh.new()
-    _build_star_bmesh(bm, spikes, outer_r, inner_r, rot_deg)
-    if star_type == "STAR_3D":
-        _extrude_thickness(bm, thick)
+    prism = star_type == "STAR_3D" and thick > 0.0
+    ring = _star_ring_coords(spikes, outer_r, inner_r, rot_deg)
+    coords = _star_mesh_coords(ring, thick if prism else 0.0)
+    sig = (spikes, int(prism))
 
     mesh = obj.data
+    params = _build_params(star_type, spikes, outer, inner, scale, thickness, rot_deg)
+
+    # Same topology as the last build (radius/scale/thickness/rotation edits): only move vertices.
+    # Element counts catch Edit Mode changes (e.g. Delete > Only Faces) that keep the vertex count.
+    if tuple(mesh.get(_TOPOLOGY_SIG_KEY, ())) == sig and len(mesh.vertices) == len(coords):
+        loop_vertex_indices, loop_start, _loop_total = _fan_topology(len(ring), prism)
+        if len(mesh.loops) == len(loop_vertex_indices) and len(mesh.polygons) == len(loop_start):
+            mesh.vertices.foreach_set("co", coords.ravel())
+            mesh.update()
+            mesh[_BUILD_PARAMS_KEY] = params
+            return
+
     mesh.clear_geometry()
-    bm.to_mesh(mesh)
-    bm.free()
-    mesh.update()
+    _write_fan_mesh(mesh, coords, prism)
+    mesh[_TOPOLOGY_SIG_KEY] = sig
+    mesh[_BUILD_PARAMS_KEY] = params
 
 
 # ============================================================
@@ -218,15 +421,8 @@ def _get_create_params(context):
     }
 
     if sp.use_preset and sp.preset_select and sp.preset_select != "NONE":
-        data = _load_presets(context)
-        p = data.get("presets", {}).get(sp.preset_select)
-        if isinstance(p, dict):
-            params["star_type"] = p.get("star_type", params["star_type"])
-            params["spikes"] = int(p.get("spikes", params["spikes"]))
-            params["outer_radius"] = float(p.get("outer_radius", params["outer_radius"]))
-            params["inner_radius"] = float(p.get("inner_radius", params["inner_radius"]))
-            params["global_scale"] = float(p.get("global_scale", params["global_scale"]))
-            params["thickness"] = float(p.get("thickness", params["thickness"]))
+        _load_presets(context)  # refresh cache if the stored JSON changed
+        params.update(_preset_cache["coerced"].get(sp.preset_select, {}))
     return params
 
 
@@ -317,8 +513,8 @@ class STAR_OT_save_preset_dialog(bpy.types.Operator):
             return {'CANCELLED'}
 
         op = obj.star_mesh_creator_obj
-        data = _load_presets(context)
-        presets = data.setdefault("presets", {})
+        data = dict(_load_presets(context))
+        presets = data["presets"] = dict(data.get("presets", {}))
         presets[name] = {
             "star_type": op.star_type,
             "spikes": int(op.spikes),
@@ -379,30 +575,65 @@ _EDITOR_RUNNING = False
 _EDITOR_DRAW_HANDLE = None
 
 
-class _UIRect:
-    __slots__ = ("x", "y", "w", "h")
+def _rect_contains(r, mx, my):
+    # r: (x, y, w, h) tuple
+    x, y, w, h = r
+    return (x <= mx <= x + w) and (y <= my <= y + h)
+
 
-    def __init__(self, x, y, w, h):
-        self.x, self.y, self.w, self.h = x, y, w, h
+class F:
+    # Editor field IDs (row order); index the rect arrays and the _FIELD_* tables
+    SPIKES = 0
+    OUTER = 1
+    INNER = 2
+    SCALE = 3
+    THICK = 4
 
-    def contains(self, mx, my):
-        return (self.x <= mx <= self.x + self.w) and (self.y <= my <= self.y + self.h)
+
+_FIELDS = (F.SPIKES, F.OUTER, F.INNER, F.SCALE, F.THICK)
+
+# Per-field tables, indexed by field ID
+_FIELD_LABELS = ("Spikes", "Outer Radius", "Inner Radius", "Global Scale", "Thickness")
+# Default values (reset target) - match PropertyGroup defaults / typical expectations
+_FIELD_DEFAULTS = (5, 1.0, 0.5, 1.0, 0.2)
+_FIELD_STEPS = (1.0, 0.01, 0.01, 0.01, 0.01)
+_FIELD_GETTERS = (
+    lambda op: int(op.spikes),
+    lambda op: float(op.outer_radius),
+    lambda op: float(op.inner_radius),
+    lambda op: float(op.global_scale),
+    lambda op: float(op.thickness),
+)
+
+
+# Placeholder for a hidden rect: negative size never contains a point
+_NO_RECT = (0, 0, -1, -1)
+
+
+def _rects_hit(xywh, mx, my):
+    # xywh: (N, 4) int32 array. Index of the first rect containing (mx, my), or -1
+    if xywh is None or not len(xywh):
+        return -1
+    x = xywh[:, 0]
+    y = xywh[:, 1]
+    mask = (x <= mx) & (mx <= x + xywh[:, 2]) & (y <= my) & (my <= y + xywh[:, 3])
+    i = int(np.argmax(mask))
+    return i if mask[i] else -1
 
 
 def _clamp(v, a, b):
     return a if v < a else b if v > b else v
 
 
-def _draw_rect(x, y, w, h, color):
-    shader = gpu.shader.from_builtin('UNIFORM_COLOR')
-    verts = [(x, y), (x + w, y), (x + w, y + h), (x, y + h)]
-    indices = [(0, 1, 2), (2, 3, 0)]
-    batch = batch_for_shader(shader, 'TRIS', {"pos": verts}, indices=indices)
-    gpu.state.blend_set('ALPHA')
-    shader.bind()
-    shader.uniform_float("color", color)
-    batch.draw(shader)
-    gpu.state.blend_set('NONE')
+# Shader is created once (lazily: no GPU context at import / in background mode)
+_RECT_SHADER = None
+
+
+def _rect_shader():
+    global _RECT_SHADER
+    if _RECT_SHADER is None:
+        _RECT_SHADER = gpu.shader.from_builtin('SMOOTH_COLOR')
+    return _RECT_SHADER
 
 
 def _draw_text(x, y, text, size=12, color=(1, 1, 1, 1)):
@@ -413,17 +644,21 @@ def _draw_text(x, y, text, size=12, color=(1, 1, 1, 1)):
     blf.draw(font_id, text)
 
 
-def _text_dimensions(text: str, size: int):
-    font_id = 0
-    blf.size(font_id, size)
-    return blf.dimensions(font_id, text)
+# (text, size) -> blf.dimensions; labels are constant and value strings repeat a lot
+_TEXT_DIM_CACHE = {}
+_TEXT_DIM_CACHE_MAX = 512
 
 
-def _draw_text_centered_in_rect(rect: _UIRect, text: str, size=11, color=(1, 1, 1, 1)):
-    tw, _th = _text_dimensions(text, size)
-    x = rect.x + (rect.w - tw) * 0.5
-    y = rect.y + (rect.h - size) * 0.5 + 2
-    _draw_text(x, y, text, size, color)
+def _text_dimensions(text: str, size: int):
+    key = (text, size)
+    dims = _TEXT_DIM_CACHE.get(key)
+    if dims is None:
+        if len(_TEXT_DIM_CACHE) >= _TEXT_DIM_CACHE_MAX:
+            _TEXT_DIM_CACHE.clear()  # drag values are unbounded; keep the cache small
+        font_id = 0
+        blf.size(font_id, size)
+        dims = _TEXT_DIM_CACHE[key] = blf.dimensions(font_id, text)
+    return dims
 
 
 def _active_star_object(context):
@@ -433,17 +668,26 @@ def _active_star_object(context):
     return None
 
 
+@lru_cache(maxsize=256)
 def _format_float(v: float) -> str:
-    # Blender-like: show up to 3 decimals by default
+    # Blender-like: show up to 3 decimals by default (cached: rows redraw the same values)
     return f"{v:.3f}"
 
 
+# Inline text input: characters accepted per field kind, numpad fallback when event.ascii is empty
+_ALLOWED_FLOAT = frozenset("0123456789.-+")
+_ALLOWED_INT = frozenset("0123456789-+")
+_NUMPAD_MAP = {
+    'NUMPAD_0': '0', 'NUMPAD_1': '1', 'NUMPAD_2': '2', 'NUMPAD_3': '3', 'NUMPAD_4': '4',
+    'NUMPAD_5': '5', 'NUMPAD_6': '6', 'NUMPAD_7': '7', 'NUMPAD_8': '8', 'NUMPAD_9': '9',
+    'NUMPAD_PERIOD': '.', 'NUMPAD_MINUS': '-', 'NUMPAD_PLUS': '+',
+}
+
+
 def _step_multiplier(event) -> float:
     # Blender-like modifiers
-    mult = 1.0
-    if getattr(event, "shift", False):
-        mult *= 10.0
-    if getattr(event, "ctrl", False):
+    mult = 10.0 if event.shift else 1.0
+    if event.ctrl:
         mult *= 0.1
     return mult
 
@@ -456,15 +700,18 @@ class STAR_OT_pinned_editor(bpy.types.Operator):
     # ---- runtime state ----
     _timer = None
     _dirty = False
-    _dirty_time = 0.0
+    _dirty_time_ns = 0  # time.monotonic_ns() of the last change
+    _debounce_ns = 30_000_000  # set per change by _set_dirty
+    _drag_debounce_ns = 150_000_000  # continuous drag: wait for the mouse to settle
+    _edit_debounce_ns = 30_000_000  # discrete edits (step, typed value, reset)
     _updating = False
-    _needs_redraw = True
+    _pending_redraw = False  # the only redraw flag: flushed right away (clicks, hover, keys) or on TIMER while dragging
 
-    # panel rect
+    # panel rect: (x0, y0, x1, y1) bounds, tested inline on every mouse event
     _rect_panel = None
 
     # hover / editing
-    _hover_field = None  # "spikes"/"outer"/"inner"/"scale"/"thick"
+    _hover_field = None  # F.* field ID
     _editing_field = None
     _editing_text = ""
     _editing_original_value = None
@@ -494,23 +741,69 @@ class STAR_OT_pinned_editor(bpy.types.Operator):
     btn_h = 16
     value_h = 18
 
-    # computed rects per field (stored each draw)
-    _row_rects = None  # dict field->row rect
-    _value_rects = None  # dict field->value rect (includes buttons area)
-    _btn_left_rects = None
+    # row colors, picked by state index in _draw_param_row
+    _COL_ROW_BG = (
+        (0.10, 0.10, 0.10, 0.55),  # normal
+        (0.12, 0.12, 0.12, 0.72),  # hover
+        (0.14, 0.14, 0.14, 0.80),  # editing
+    )
+    _COL_VAL_BG = (
+        (0.16, 0.16, 0.16, 0.85),  # normal
+        (0.19, 0.19, 0.19, 0.92),  # hover
+        (0.22, 0.22, 0.22, 0.98),  # カーソル編集モード: 通常の編集背景色
+        (0.20, 0.35, 0.55, 0.98),  # 全選択モード: 選択状態の背景色（青みがかった色）
+    )
+    _COL_BTN_BG = (
+        (0.14, 0.14, 0.14, 0.80),  # editing (not hovered)
+        (0.18, 0.18, 0.18, 0.92),  # hover
+    )
+    _COL_ROW_TEXT = (0.92, 0.92, 0.92, 1)
+    _COL_VAL_TEXT = (0.95, 0.95, 0.95, 1)
+
+    # x-only layout (plain ints), built once from the constants above
+    _layout = None
+
+    # computed rects per field: (len(_FIELDS), 4) int32 x/y/w/h arrays allocated
+    # in invoke and overwritten in place each draw; row = field ID
+    _row_rects = None
+    _value_rects = None  # value area (includes buttons area)
+    _btn_left_rects = None  # _NO_RECT unless hovered/editing
     _btn_right_rects = None
 
+    # hover lookup (rows top-down, shared value-area x range, top edge of first value area)
+    _hover_fields = ()
+    _hover_x = (0, 0)
+    _hover_top = 0
+
     # footer buttons
     _rect_save = None
     _rect_close = None
 
-    _timer_interval = 0.10  # for debounce + caret blink
+    # last built frame (replayed while _draw_state_key is unchanged)
+    _last_draw_key = None
+    _frame_batch = None
+    _frame_texts = ()
+
+    # VIEW_3D areas to tag (the overlay draws in all of them); rescanned when the screen changes
+    _view3d_screen = None
+    _view3d_areas = ()
+
+    # timer tick: flushes coalesced redraws; debounce is timed separately (_debounce_ns)
+    _timer_interval = 0.10
+    _drag_timer_interval = 1.0 / 30.0  # only while a drag rebuild is pending
+    _timer_step = None  # interval of the live timer
 
     # --------------------------------------------------------
 
     def _ensure_timer(self, context):
-        if self._timer is None:
-            self._timer = context.window_manager.event_timer_add(self._timer_interval, window=context.window)
+        # Short tick while dragging with a rebuild pending; otherwise the regular one
+        step = self._drag_timer_interval if (self._dragging_value and self._dirty) else self._timer_interval
+        if self._timer is not None:
+            if self._timer_step == step:
+                return
+            context.window_manager.event_timer_remove(self._timer)
+        self._timer = context.window_manager.event_timer_add(step, window=context.window)
+        self._timer_step = step
 
     def _stop_timer_if_idle(self, context):
         if self._timer is None:
@@ -523,25 +816,49 @@ class STAR_OT_pinned_editor(bpy.types.Operator):
         except Exception:
             pass
         self._timer = None
+        self._timer_step = None
 
     def _tag_redraw_view3d(self, context):
-        if not self._needs_redraw:
+        if not self._pending_redraw:
             return
-        self._needs_redraw = False
-        for area in context.window.screen.areas:
-            if area.type == 'VIEW_3D':
+        self._pending_redraw = False
+        screen = context.window.screen
+        if screen != self._view3d_screen:
+            self._cache_view3d_areas(context)
+        try:
+            for area in self._view3d_areas:
+                area.tag_redraw()
+        except ReferenceError:
+            # area was freed (screen layout edited); rescan once
+            self._cache_view3d_areas(context)
+            for area in self._view3d_areas:
                 area.tag_redraw()
 
+    def _cache_view3d_areas(self, context):
+        screen = context.window.screen
+        self._view3d_screen = screen
+        self._view3d_areas = tuple(a for a in screen.areas if a.type == 'VIEW_3D')
+
+    def _request_redraw(self, context):
+        # Flushed on the next TIMER tick (at most one tag per tick): drag MOUSEMOVE only
+        self._pending_redraw = True
+        self._ensure_timer(context)
+
+    def _redraw_now(self, context):
+        # Clicks, hover changes, commits: tag right away (Blender merges repeated tags anyway)
+        self._pending_redraw = True
+        self._tag_redraw_view3d(context)
+
     def _set_dirty(self, context):
         self._dirty = True
-        self._dirty_time = time.time()
-        self._needs_redraw = True
-        self._ensure_timer(context)
+        self._dirty_time_ns = time.monotonic_ns()
+        self._debounce_ns = self._drag_debounce_ns if self._dragging_value else self._edit_debounce_ns
+        self._request_redraw(context)
 
     def _debounced_rebuild(self, context) -> bool:
         if not self._dirty:
             return False
-        if (time.time() - self._dirty_time) < 0.10:
+        if time.monotonic_ns() - self._dirty_time_ns < self._debounce_ns:
             return False
 
         obj = _active_star_object(context)
@@ -555,6 +872,8 @@ class STAR_OT_pinned_editor(bpy.types.Operator):
             return False
 
         op = obj.star_mesh_creator_obj
+        if _mesh_is_built(obj, op):
+            return False  # e.g. a drag that came back to the built value
         ok, _ = _validate(op.star_type, op.spikes, op.outer_radius, op.inner_radius, op.global_scale, op.thickness)
         if not ok:
             return False
@@ -581,72 +900,32 @@ class STAR_OT_pinned_editor(bpy.types.Operator):
     # Value access helpers
 
     def _get_field_value(self, op, field):
-        if field == "spikes":
-            return int(op.spikes)
-        if field == "outer":
-            return float(op.outer_radius)
-        if field == "inner":
-            return float(op.inner_radius)
-        if field == "scale":
-            return float(op.global_scale)
-        if field == "thick":
-            return float(op.thickness)
-        return 0.0
+        return _FIELD_GETTERS[field](op)
 
     def _set_field_value(self, op, field, value):
         # clamp + dependency rules
-        if field == "spikes":
+        if field == F.SPIKES:
             op.spikes = max(3, min(256, int(round(value))))
-            return
-
-        if field == "outer":
+        elif field == F.OUTER:
             op.outer_radius = max(0.0001, float(value))
             if op.inner_radius >= op.outer_radius:
                 op.inner_radius = max(0.0001, op.outer_radius * 0.5)
-            return
-
-        if field == "inner":
+        elif field == F.INNER:
             v = max(0.0001, float(value))
             op.inner_radius = min(v, max(0.0001, op.outer_radius * 0.999))
-            return
-
-        if field == "scale":
+        elif field == F.SCALE:
             op.global_scale = max(0.0001, float(value))
-            return
-
-        if field == "thick":
+        elif field == F.THICK:
             op.thickness = max(0.0, float(value))
-            return
-
 
     def _field_default(self, field):
-        # Default values (reset target) - match PropertyGroup defaults / typical expectations
-        if field == "spikes":
-            return 5
-        if field == "outer":
-            return 1.0
-        if field == "inner":
-            return 0.5
-        if field == "scale":
-            return 1.0
-        if field == "thick":
-            return 0.2
-        return 0.0
+        return _FIELD_DEFAULTS[field]
 
     def _field_step(self, field) -> float:
-        if field == "spikes":
-            return 1.0
-        # float fields
-        return 0.01
+        return _FIELD_STEPS[field]
 
     def _field_label(self, field) -> str:
-        return {
-            "spikes": "Spikes",
-            "outer": "Outer Radius",
-            "inner": "Inner Radius",
-            "scale": "Global Scale",
-            "thick": "Thickness",
-        }.get(field, field)
+        return _FIELD_LABELS[field]
 
     # --------------------------------------------------------
     # Inline editing
@@ -664,10 +943,9 @@ class STAR_OT_pinned_editor(bpy.types.Operator):
         self._editing_field = field
         self._editing_original_value = self._get_field_value(op, field)
         v = self._editing_original_value
-        self._editing_text = str(v) if field == "spikes" else _format_float(float(v))
+        self._editing_text = str(v) if field == F.SPIKES else _format_float(float(v))
         self._editing_select_all = select_all
-        self._needs_redraw = True
-        self._ensure_timer(context)
+        self._pending_redraw = True
 
     def _cancel_editing(self, context):
         if self._editing_field is None:
@@ -681,7 +959,7 @@ class STAR_OT_pinned_editor(bpy.types.Operator):
         self._editing_text = ""
         self._editing_original_value = None
         self._editing_select_all = True
-        self._needs_redraw = True
+        self._pending_redraw = True
 
     def _commit_editing(self, context):
         if self._editing_field is None:
@@ -700,7 +978,7 @@ class STAR_OT_pinned_editor(bpy.types.Operator):
             v = self._field_default(self._editing_field)
         else:
             try:
-                if self._editing_field == "spikes":
+                if self._editing_field == F.SPIKES:
                     v = int(float(text))
                 else:
                     v = float(text)
@@ -708,9 +986,9 @@ class STAR_OT_pinned_editor(bpy.types.Operator):
                 v = self._field_default(self._editing_field)
 
         # 0 input also resets to default (common in DCC UIs)
-        if self._editing_field == "spikes":
+        if self._editing_field == F.SPIKES:
             if int(v) == 0:
-                v = self._field_default("spikes")
+                v = self._field_default(F.SPIKES)
         else:
             try:
                 if abs(float(v)) < 1e-12:
@@ -719,18 +997,22 @@ class STAR_OT_pinned_editor(bpy.types.Operator):
                 v = self._field_default(self._editing_field)
 
         self._set_field_value(op, self._editing_field, v)
+        # Committed the value it already had (after clamping): nothing to validate or rebuild
+        changed = self._get_field_value(op, self._editing_field) != self._editing_original_value
 
-        ok, _msg = _validate(op.star_type, op.spikes, op.outer_radius, op.inner_radius, op.global_scale, op.thickness)
-        if not ok:
-            self._cancel_editing(context)
-            return
+        if changed:
+            ok, _msg = _validate(op.star_type, op.spikes, op.outer_radius, op.inner_radius, op.global_scale, op.thickness)
+            if not ok:
+                self._cancel_editing(context)
+                return
 
         self._editing_field = None
         self._editing_text = ""
         self._editing_original_value = None
         self._editing_select_all = True
-        self._set_dirty(context)
-        self._needs_redraw = True
+        if changed:
+            self._set_dirty(context)
+        self._pending_redraw = True
 
     def _handle_text_input(self, context, event) -> bool:
         """Return True if event consumed."""
@@ -755,7 +1037,7 @@ class STAR_OT_pinned_editor(bpy.types.Operator):
                 # カーソル編集モード → 末尾1文字削除
                 if self._editing_text:
                     self._editing_text = self._editing_text[:-1]
-            self._needs_redraw = True
+            self._pending_redraw = True
             return True
 
         # Ignore non-press
@@ -768,21 +1050,13 @@ class STAR_OT_pinned_editor(bpy.types.Operator):
             ch = event.ascii
         else:
             # Fallback for numpad keys (Blender sometimes doesn't provide ascii)
-            numpad_map = {
-                'NUMPAD_0': '0', 'NUMPAD_1': '1', 'NUMPAD_2': '2', 'NUMPAD_3': '3', 'NUMPAD_4': '4',
-                'NUMPAD_5': '5', 'NUMPAD_6': '6', 'NUMPAD_7': '7', 'NUMPAD_8': '8', 'NUMPAD_9': '9',
-                'NUMPAD_PERIOD': '.', 'NUMPAD_MINUS': '-', 'NUMPAD_PLUS': '+',
-            }
-            ch = numpad_map.get(event.type, "")
+            ch = _NUMPAD_MAP.get(event.type, "")
 
         if not ch:
             # swallow other keys while editing so viewport doesn't react
             return True
 
-        allowed = "0123456789.-+"
-        if self._editing_field == "spikes":
-            allowed = "0123456789-+"
-
+        allowed = _ALLOWED_INT if self._editing_field == F.SPIKES else _ALLOWED_FLOAT
         if ch in allowed:
             if self._editing_select_all:
                 # 全選択モードで入力 → 既存テキストをクリアして入力
@@ -791,90 +1065,143 @@ class STAR_OT_pinned_editor(bpy.types.Operator):
             else:
                 # カーソル編集モード → 末尾に追加
                 self._editing_text += ch
-            self._needs_redraw = True
+            self._pending_redraw = True
         return True
 
     # --------------------------------------------------------
     # Hover detection
 
     def _update_hover(self, mx, my):
+        # Rows are evenly spaced: map my to a row index, then check the shared value-area box
         self._hover_field = None
-        if not self._value_rects:
+        fields = self._hover_fields
+        if not fields:
             return
-
-        # detect over value interaction area (value box + btns)
-        for field, rect in self._value_rects.items():
-            if rect and rect.contains(mx, my):
-                self._hover_field = field
-                return
+        x_min, x_max = self._hover_x
+        if not (x_min <= mx <= x_max):
+            return
+        top = self._hover_top
+        idx = int((top - my) // self.row_h)
+        if 0 <= idx < len(fields) and my >= top - idx * self.row_h - self.value_h:
+            self._hover_field = fields[idx]
 
     # --------------------------------------------------------
     # Drawing
 
-    def _compute_panel_height(self, context):
+    # Per-frame draw lists: all rects go out as one batch, then text on top
+
+    def _begin_frame(self):
+        self._frame_verts = []
+        self._frame_colors = []
+        self._frame_indices = []
+        self._frame_texts = []
+
+    def _queue_rect(self, x, y, w, h, color):
+        i = len(self._frame_verts)
+        self._frame_verts += ((x, y), (x + w, y), (x + w, y + h), (x, y + h))
+        self._frame_colors += (color, color, color, color)
+        self._frame_indices += ((i, i + 1, i + 2), (i + 2, i + 3, i))
+
+    def _queue_text(self, x, y, text, size=12, color=(1, 1, 1, 1)):
+        self._frame_texts.append((x, y, text, size, color))
+
+    def _queue_text_centered_in_rect(self, rect, text: str, size=11, color=(1, 1, 1, 1)):
+        rx, ry, rw, rh = rect
+        tw, _th = _text_dimensions(text, size)
+        x = rx + (rw - tw) * 0.5
+        y = ry + (rh - size) * 0.5 + 2
+        self._queue_text(x, y, text, size, color)
+
+    def _end_frame(self):
+        # Bake the queued rects into one batch; kept for replay while nothing changes
+        self._frame_batch = None
+        if self._frame_verts:
+            self._frame_batch = batch_for_shader(
+                _rect_shader(), 'TRIS', {"pos": self._frame_verts, "color": self._frame_colors}, indices=self._frame_indices
+            )
+
+    def _replay_frame(self):
+        if self._frame_batch is not None:
+            shader = _rect_shader()
+            gpu.state.blend_set('ALPHA')
+            shader.bind()
+            self._frame_batch.draw(shader)
+            gpu.state.blend_set('NONE')
+        for x, y, text, size, color in self._frame_texts:
+            _draw_text(x, y, text, size, color)
+
+    def _draw_state_key(self, context):
+        # Everything _draw reads; equal key -> identical frame
         obj = _active_star_object(context)
-        has_target = bool(obj)
-        is_3d = has_target and (obj.star_mesh_creator_obj.star_type == "STAR_3D")
+        if obj is None:
+            return (None,)
+        op = obj.star_mesh_creator_obj
+        return (
+            obj.name, op.star_type, op.spikes, op.outer_radius, op.inner_radius, op.global_scale, op.thickness,
+            self._hover_field, self._editing_field, self._editing_text, self._editing_select_all,
+        )
+
+    def _compute_panel_height(self, is_3d: bool):
         rows = 4 + (1 if is_3d else 0)
         return self.pad * 2 + self.header_h + self.sub_h + rows * self.row_h + self.footer_h
 
-    def _draw_param_row(self, x0, y, field, op, hovered: bool, editing: bool):
-        # Row background highlight (subtle)
-        bg = (0.10, 0.10, 0.10, 0.55)
-        if hovered:
-            bg = (0.12, 0.12, 0.12, 0.72)
-        if editing:
-            bg = (0.14, 0.14, 0.14, 0.80)
+    def _build_layout(self):
+        # Everything except y is fixed by the class constants
+        base_x = self.pad + 12 + self.label_w
+        value_x = base_x + self.btn_w + self.gap
+        footer_btn_w = int((self.w - 10 * 2 - 8) / 2)
+        return {
+            "row_x": self.pad + 6,
+            "row_w": self.w - 12,
+            "label_x": self.pad + 12,
+            "base_x": base_x,
+            "value_x": value_x,
+            "right_btn_x": value_x + self.value_w + self.gap,
+            "val_w": self.value_w,
+            "full_w": self.btn_w + self.gap + self.value_w + self.gap + self.btn_w,
+            "save_rect": (self.pad + 10, self.pad + 8, footer_btn_w, 20),
+            "close_rect": (self.pad + 10 + footer_btn_w + 8, self.pad + 8, footer_btn_w, 20),
+        }
 
-        row_rect = _UIRect(x0 + 6, y + 2, self.w - 12, self.row_h - 4)
+    def _draw_param_row(self, y, field, op, hovered: bool, editing: bool):
+        L = self._layout
+        # Row background highlight (subtle)
+        row_rect = (L["row_x"], y + 2, L["row_w"], self.row_h - 4)
         self._row_rects[field] = row_rect
-        _draw_rect(row_rect.x, row_rect.y, row_rect.w, row_rect.h, bg)
+        self._queue_rect(*row_rect, self._COL_ROW_BG[2 if editing else int(hovered)])
 
         # Label
-        _draw_text(x0 + 12, y + 7, self._field_label(field), 11, (0.92, 0.92, 0.92, 1))
+        self._queue_text(L["label_x"], y + 7, self._field_label(field), 11, self._COL_ROW_TEXT)
 
         # Value interaction area
-        base_x = x0 + 12 + self.label_w
-        value_x = base_x + self.btn_w + self.gap
-        right_btn_x = value_x + self.value_w + self.gap
+        vy = y + 4
+        value_x = L["value_x"]
+        val_w = L["val_w"]
 
         # Value area rect includes buttons (hover target)
-        full_rect = _UIRect(base_x, y + 4, self.btn_w + self.gap + self.value_w + self.gap + self.btn_w, self.value_h)
-        self._value_rects[field] = full_rect
+        self._value_rects[field] = (L["base_x"], vy, L["full_w"], self.value_h)
 
         # Buttons appear only on hover or editing (like Blender)
         show_arrows = hovered or editing
-        left_rect = _UIRect(base_x, y + 4, self.btn_w, self.btn_h) if show_arrows else None
-        right_rect = _UIRect(right_btn_x, y + 4, self.btn_w, self.btn_h) if show_arrows else None
+        left_rect = (L["base_x"], vy, self.btn_w, self.btn_h) if show_arrows else _NO_RECT
+        right_rect = (L["right_btn_x"], vy, self.btn_w, self.btn_h) if show_arrows else _NO_RECT
         self._btn_left_rects[field] = left_rect
         self._btn_right_rects[field] = right_rect
 
-        # Value box
-        val_rect = _UIRect(value_x, y + 4, self.value_w, self.value_h)
-
         # Blender-ish field color: slightly brighter on hover/edit
-        val_bg = (0.16, 0.16, 0.16, 0.85)
-        if hovered:
-            val_bg = (0.19, 0.19, 0.19, 0.92)
         if editing:
-            if self._editing_select_all:
-                # 全選択モード: 選択状態の背景色（青みがかった色）
-                val_bg = (0.20, 0.35, 0.55, 0.98)
-            else:
-                # カーソル編集モード: 通常の編集背景色
-                val_bg = (0.22, 0.22, 0.22, 0.98)
-
-        _draw_rect(val_rect.x, val_rect.y, val_rect.w, val_rect.h, val_bg)
+            val_bg = self._COL_VAL_BG[3 if self._editing_select_all else 2]
+        else:
+            val_bg = self._COL_VAL_BG[int(hovered)]
+        self._queue_rect(value_x, vy, val_w, self.value_h, val_bg)
 
         # Arrows
         if show_arrows:
-            btn_bg = (0.14, 0.14, 0.14, 0.80)
-            if hovered:
-                btn_bg = (0.18, 0.18, 0.18, 0.92)
-            _draw_rect(left_rect.x, left_rect.y, left_rect.w, left_rect.h, btn_bg)
-            _draw_rect(right_rect.x, right_rect.y, right_rect.w, right_rect.h, btn_bg)
-            _draw_text_centered_in_rect(left_rect, "<", 11, (0.92, 0.92, 0.92, 1))
-            _draw_text_centered_in_rect(right_rect, ">", 11, (0.92, 0.92, 0.92, 1))
+            btn_bg = self._COL_BTN_BG[int(hovered)]
+            self._queue_rect(*left_rect, btn_bg)
+            self._queue_rect(*right_rect, btn_bg)
+            self._queue_text_centered_in_rect(left_rect, "<", 11, self._COL_ROW_TEXT)
+            self._queue_text_centered_in_rect(right_rect, ">", 11, self._COL_ROW_TEXT)
 
         # Value text (editing shows caret if not select_all)
         if editing:
@@ -884,77 +1211,81 @@ class STAR_OT_pinned_editor(bpy.types.Operator):
                 txt = txt + "|"
         else:
             v = self._get_field_value(op, field)
-            txt = str(v) if field == "spikes" else _format_float(float(v))
+            txt = str(v) if field == F.SPIKES else _format_float(float(v))
 
         # right-aligned in value box
         tw, _ = _text_dimensions(txt, 11)
-        tx = val_rect.x + val_rect.w - tw - 4
-        ty = val_rect.y + 3
-        _draw_text(tx, ty, txt, 11, (0.95, 0.95, 0.95, 1))
+        tx = value_x + val_w - tw - 4
+        ty = vy + 3
+        self._queue_text(tx, ty, txt, 11, self._COL_VAL_TEXT)
 
     def _draw(self, context):
-        panel_h = self._compute_panel_height(context)
-        x0 = self.pad
-        y0 = self.pad
-
-        self._rect_panel = _UIRect(x0, y0, self.w, panel_h)
-
         obj = _active_star_object(context)
         has_target = bool(obj)
         op = obj.star_mesh_creator_obj if has_target else None
         is_3d = has_target and (op.star_type == "STAR_3D")
 
-        # reset rect dicts
-        self._row_rects = {}
-        self._value_rects = {}
-        self._btn_left_rects = {}
-        self._btn_right_rects = {}
+        panel_h = self._compute_panel_height(is_3d)
+        x0 = self.pad
+        y0 = self.pad
+
+        self._rect_panel = (x0, y0, x0 + self.w, y0 + panel_h)
 
-        _draw_rect(x0, y0, self.w, panel_h, (0.08, 0.08, 0.08, 0.78))
-        _draw_text(x0 + 10, y0 + panel_h - 20, "Star Edit", 13, (1, 1, 1, 1))
+        # hide every slot; rows drawn below overwrite theirs
+        for rects in (self._row_rects, self._value_rects, self._btn_left_rects, self._btn_right_rects):
+            rects[:] = _NO_RECT
+        self._hover_fields = ()
+
+        self._queue_rect(x0, y0, self.w, panel_h, (0.08, 0.08, 0.08, 0.78))
+        self._queue_text(x0 + 10, y0 + panel_h - 20, "Star Edit", 13, (1, 1, 1, 1))
 
         target_txt = obj.name if has_target else "(No Star Selected)"
-        _draw_text(x0 + 10, y0 + panel_h - 42, f"Target: {target_txt}", 11, (0.9, 0.9, 0.9, 1))
+        self._queue_text(x0 + 10, y0 + panel_h - 42, f"Target: {target_txt}", 11, (0.9, 0.9, 0.9, 1))
 
         if not has_target:
-            _draw_text(x0 + 10, y0 + panel_h - 62, "Select a Star created by this addon.", 11, (1, 0.8, 0.2, 1))
+            self._queue_text(x0 + 10, y0 + panel_h - 62, "Select a Star created by this addon.", 11, (1, 0.8, 0.2, 1))
             self._rect_save = self._rect_close = None
             return
 
         ok, msg = _validate(op.star_type, op.spikes, op.outer_radius, op.inner_radius, op.global_scale, op.thickness)
         if not ok:
-            _draw_text(x0 + 10, y0 + panel_h - 62, f"Invalid: {msg}", 11, (1, 0.35, 0.35, 1))
+            self._queue_text(x0 + 10, y0 + panel_h - 62, f"Invalid: {msg}", 11, (1, 0.35, 0.35, 1))
 
         # rows start
         y = y0 + panel_h - 42 - self.sub_h - self.row_h
 
-        fields = ["spikes", "outer", "inner", "scale"]
-        if is_3d:
-            fields.append("thick")
+        fields = _FIELDS if is_3d else _FIELDS[:4]
+
+        # hover lookup: value areas share one x range and sit one row_h apart
+        L = self._layout
+        self._hover_fields = fields
+        self._hover_x = (L["base_x"], L["base_x"] + L["full_w"])
+        self._hover_top = y + 4 + self.value_h
 
         for f in fields:
             hovered = (self._hover_field == f)
             editing = (self._editing_field == f)
-            self._draw_param_row(x0, y, f, op, hovered, editing)
+            self._draw_param_row(y, f, op, hovered, editing)
             y -= self.row_h
 
         # Footer buttons
-        footer_y = y0 + 8
-        btn_h = 20
-        btn_gap = 8
-        btn_w = int((self.w - 10 * 2 - btn_gap) / 2)
-
-        self._rect_save = _UIRect(x0 + 10, footer_y, btn_w, btn_h)
-        self._rect_close = _UIRect(x0 + 10 + btn_w + btn_gap, footer_y, btn_w, btn_h)
+        self._rect_save = L["save_rect"]
+        self._rect_close = L["close_rect"]
 
-        _draw_rect(self._rect_save.x, self._rect_save.y, self._rect_save.w, self._rect_save.h, (0.25, 0.25, 0.25, 0.95))
-        _draw_text_centered_in_rect(self._rect_save, "Save Preset", 10, (1, 1, 1, 1))
+        self._queue_rect(*self._rect_save, (0.25, 0.25, 0.25, 0.95))
+        self._queue_text_centered_in_rect(self._rect_save, "Save Preset", 10, (1, 1, 1, 1))
 
-        _draw_rect(self._rect_close.x, self._rect_close.y, self._rect_close.w, self._rect_close.h, (0.25, 0.25, 0.25, 0.95))
-        _draw_text_centered_in_rect(self._rect_close, "Close", 10, (1, 1, 1, 1))
+        self._queue_rect(*self._rect_close, (0.25, 0.25, 0.25, 0.95))
+        self._queue_text_centered_in_rect(self._rect_close, "Close", 10, (1, 1, 1, 1))
 
     def _draw_callback(self, _self, context):
-        self._draw(context)
+        key = self._draw_state_key(context)
+        if key != self._last_draw_key:
+            self._begin_frame()
+            self._draw(context)
+            self._end_frame()
+            self._last_draw_key = key
+        self._replay_frame()
 
     # --------------------------------------------------------
     # Interactions
@@ -984,7 +1315,7 @@ class STAR_OT_pinned_editor(bpy.types.Operator):
         self._ensure_timer(context)
 
     def _update_value_drag(self, context, mx, event):
-        if not self._drag_field:
+        if self._drag_field is None:
             return
         dx = mx - self._drag_start_x
         if not self._dragging_value:
@@ -1003,7 +1334,7 @@ class STAR_OT_pinned_editor(bpy.types.Operator):
         field = self._drag_field
         mult = _step_multiplier(event)
 
-        if field == "spikes":
+        if field == F.SPIKES:
             # 10px per spike step
             delta = int(round(dx / 10.0))
             self._set_field_value(op, field, self._drag_start_value + delta)
@@ -1023,6 +1354,11 @@ class STAR_OT_pinned_editor(bpy.types.Operator):
         self._drag_field = None
         self._dragging_value = False
         self._click_initiated_field = None
+        if was_dragging and self._dirty:
+            # mouse released: no need to keep waiting for it to settle
+            self._debounce_ns = self._edit_debounce_ns
+        if was_dragging and self._timer is not None:
+            self._ensure_timer(context)  # back to the regular tick
         
         # 閾値未満のクリック（ドラッグしなかった）→ シングルクリックとして編集開始
         if not was_dragging and click_field is not None:
@@ -1051,7 +1387,12 @@ class STAR_OT_pinned_editor(bpy.types.Operator):
             return {'CANCELLED'}
 
         _EDITOR_RUNNING = True
-        self._needs_redraw = True
+        self._pending_redraw = True
+        self._layout = self._build_layout()
+        self._cache_view3d_areas(context)
+        self._row_rects, self._value_rects, self._btn_left_rects, self._btn_right_rects = (
+            np.full((len(_FIELDS), 4), _NO_RECT, dtype=np.int32) for _ in range(4)
+        )
 
         _EDITOR_DRAW_HANDLE = bpy.types.SpaceView3D.draw_handler_add(
             self._draw_callback, (self, context), 'WINDOW', 'POST_PIXEL'
@@ -1076,11 +1417,12 @@ class STAR_OT_pinned_editor(bpy.types.Operator):
 
         if event.type == 'TIMER':
 
-            did = self._debounced_rebuild(context)
-            if did:
-                self._needs_redraw = True
+            if self._debounced_rebuild(context):
+                self._pending_redraw = True
 
             self._stop_timer_if_idle(context)
+            if self._timer is not None:
+                self._ensure_timer(context)  # drop back to the regular tick once the rebuild is done
             self._tag_redraw_view3d(context)
             return {'PASS_THROUGH'}
 
@@ -1088,23 +1430,22 @@ class STAR_OT_pinned_editor(bpy.types.Operator):
         if event.type in {'LEFTMOUSE', 'MOUSEMOVE'}:
             mx = event.mouse_region_x
             my = event.mouse_region_y
-            if self._drag_field is None:
-                if self._rect_panel and (not self._rect_panel.contains(mx, my)):
+            panel = self._rect_panel
+            if self._drag_field is None and panel is not None:
+                if not (panel[0] <= mx <= panel[2] and panel[1] <= my <= panel[3]):
                     # パネル外でのクリック処理
                     if event.type == 'LEFTMOUSE' and event.value == 'PRESS':
                         # パネル外クリック → 編集中なら確定
                         if self._editing_field is not None:
                             self._commit_editing(context)
-                            self._needs_redraw = True
-                            self._tag_redraw_view3d(context)
+                            self._redraw_now(context)
                         return {'PASS_THROUGH'}
                     
                     if event.type == 'MOUSEMOVE':
                         # clear hover if we leave panel
                         if self._hover_field is not None:
                             self._hover_field = None
-                            self._needs_redraw = True
-                            self._tag_redraw_view3d(context)
+                            self._redraw_now(context)
                     return {'PASS_THROUGH'}
 
         # Update hover on move (only within panel)
@@ -1113,17 +1454,15 @@ class STAR_OT_pinned_editor(bpy.types.Operator):
             my = event.mouse_region_y
             prev = self._hover_field
             self._update_hover(mx, my)
-            if self._hover_field != prev:
-                self._needs_redraw = True
-                self._tag_redraw_view3d(context)
 
-            # Dragging value?
+            # Dragging value? (the only redraw coalesced onto the timer)
             if self._drag_field is not None:
                 self._update_value_drag(context, mx, event)
-                self._needs_redraw = True
-                self._tag_redraw_view3d(context)
+                self._request_redraw(context)
                 return {'RUNNING_MODAL'}
 
+            if self._hover_field != prev:
+                self._redraw_now(context)
             return {'PASS_THROUGH'}
 
         # Click handling
@@ -1133,7 +1472,7 @@ class STAR_OT_pinned_editor(bpy.types.Operator):
 
             if event.value == 'PRESS':
                 # Footer
-                if self._rect_save and self._rect_save.contains(mx, my):
+                if self._rect_save and _rect_contains(self._rect_save, mx, my):
                     # 編集中なら確定
                     if self._editing_field is not None:
                         self._commit_editing(context)
@@ -1141,11 +1480,10 @@ class STAR_OT_pinned_editor(bpy.types.Operator):
                         bpy.ops.star_mesh_creator.save_preset_dialog('INVOKE_DEFAULT')
                     except Exception:
                         pass
-                    self._needs_redraw = True
-                    self._tag_redraw_view3d(context)
+                    self._redraw_now(context)
                     return {'RUNNING_MODAL'}
 
-                if self._rect_close and self._rect_close.contains(mx, my):
+                if self._rect_close and _rect_contains(self._rect_close, mx, my):
                     # 編集中なら確定
                     if self._editing_field is not None:
                         self._commit_editing(context)
@@ -1153,45 +1491,32 @@ class STAR_OT_pinned_editor(bpy.types.Operator):
                     return {'CANCELLED'}
 
                 # If clicked on arrows (only exist when hover/edit)
-                for field in list(self._btn_left_rects.keys()):
-                    lrect = self._btn_left_rects.get(field)
-                    rrect = self._btn_right_rects.get(field)
-                    if lrect and lrect.contains(mx, my):
-                        # If editing another field, commit it first (Blender-like)
-                        if self._editing_field is not None and self._editing_field != field:
-                            self._commit_editing(context)
-                        elif self._editing_field == field:
-                            self._commit_editing(context)
-                        self._apply_step(context, field, -1, event)
-                        self._needs_redraw = True
-                        self._tag_redraw_view3d(context)
-                        return {'RUNNING_MODAL'}
-                    if rrect and rrect.contains(mx, my):
-                        if self._editing_field is not None and self._editing_field != field:
-                            self._commit_editing(context)
-                        elif self._editing_field == field:
-                            self._commit_editing(context)
-                        self._apply_step(context, field, +1, event)
-                        self._needs_redraw = True
-                        self._tag_redraw_view3d(context)
-                        return {'RUNNING_MODAL'}
+                li = _rects_hit(self._btn_left_rects, mx, my)
+                ri = -1 if li >= 0 else _rects_hit(self._btn_right_rects, mx, my)
+                if li >= 0 or ri >= 0:
+                    field = _FIELDS[li if li >= 0 else ri]
+                    step = -1 if li >= 0 else +1
+                    # If editing (this or another field), commit it first (Blender-like)
+                    if self._editing_field is not None:
+                        self._commit_editing(context)
+                    self._apply_step(context, field, step, event)
+                    self._redraw_now(context)
+                    return {'RUNNING_MODAL'}
 
                 # シングルクリック in value area: ドラッグ候補開始
                 # （マウスリリース時に閾値未満ならシングルクリックとして全選択編集モードに入る）
-                for field, vrect in (self._value_rects or {}).items():
-                    if vrect and vrect.contains(mx, my):
-                        self._start_value_drag(context, field, mx)
-                        self._needs_redraw = True
-                        self._tag_redraw_view3d(context)
-                        return {'RUNNING_MODAL'}
+                vi = _rects_hit(self._value_rects, mx, my)
+                if vi >= 0:
+                    self._start_value_drag(context, _FIELDS[vi], mx)
+                    self._redraw_now(context)
+                    return {'RUNNING_MODAL'}
 
             elif event.value == 'RELEASE':
                 if self._drag_field is not None:
                     # ドラッグ終了（閾値未満ならシングルクリックとして処理）
                     started_edit = self._end_value_drag(context)
                     self._stop_timer_if_idle(context)
-                    self._needs_redraw = True
-                    self._tag_redraw_view3d(context)
+                    self._redraw_now(context)
                     return {'RUNNING_MODAL'}
 
         # Allow other events to pass through
@@ -1206,6 +1531,7 @@ class STAR_OT_pinned_editor(bpy.types.Operator):
             except Exception:
                 pass
             self._timer = None
+            self._timer_step = None
 
         try:
             if _EDITOR_DRAW_HANDLE is not None:
@@ -1240,6 +1566,7 @@ def register():
         bpy.utils.register_class(c)
     bpy.types.Object.star_mesh_creator_obj = PointerProperty(type=STAR_ObjProps)
     bpy.types.Scene.star_mesh_creator = PointerProperty(type=STAR_SceneProps)
+    bpy.app.handlers.load_post.append(_on_load_post)
 
 
 def unregister():
@@ -1252,6 +1579,13 @@ def unregister():
             pass
         _EDITOR_DRAW_HANDLE = None
 
+    _TEXT_DIM_CACHE.clear()
+    _format_float.cache_clear()
+    _fan_topology_cache.clear()
+
+    if _on_load_post in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(_on_load_post)
+
     del bpy.types.Scene.star_mesh_creator
     del bpy.types.Object.star_mesh_creator_obj
     for c in reversed(classes):
@@ -9,10 +9,24 @@ bl_info = {
 }
 
 import bpy
-import bmesh
 import math
 import json
 import time
+from functools import lru_cache
+
+import numpy as np
+
+try:
+    from numba import njit
+    _HAS_NUMBA = True
+except ImportError:
+    # Numba is not bundled with Blender: the ring is built with the NumPy path instead
+    _HAS_NUMBA = False
+
+    def njit(*_args, **_kwargs):
+        def _decorate(fn):
+            return fn
+        return _decorate
 
 from bpy.props import (
     BoolProperty,
@@ -40,9 +54,14 @@ def _root_collection(context) -> bpy.types.Collection:
     return context.scene.collection
 
 
-def _load_presets(context) -> dict:
-    col = _root_collection(context)
-    raw = col.get(_PRESET_KEY, "")
+# Last parsed preset JSON and the enum items built from it.
+# Keyed by string equality: the ID property hands back a new str object on every read.
+# The cached data is shared; copy before modifying it.
+_PRESET_CACHE = {"raw": None, "data": None, "names": None, "items": None}
+_NO_PRESET_ITEMS = [("NONE", "(no presets)", "No presets available")]
+
+
+def _parse_presets(raw: str) -> dict:
     if not raw:
         return {"version": _PRESET_SCHEMA_VERSION, "presets": {}}
     try:
@@ -57,28 +76,48 @@ def _load_presets(context) -> dict:
         return {"version": _PRESET_SCHEMA_VERSION, "presets": {}}
 
 
+def _load_presets(context) -> dict:
+    col = _root_collection(context)
+    raw = col.get(_PRESET_KEY, "")
+    if raw != _PRESET_CACHE["raw"]:
+        _PRESET_CACHE["data"] = _parse_presets(raw)
+        _PRESET_CACHE["raw"] = raw
+    return _PRESET_CACHE["data"]
+
+
 def _save_presets(context, data: dict) -> None:
     col = _root_collection(context)
-    col[_PRESET_KEY] = json.dumps(data, ensure_ascii=False, indent=2)
+    # machine-read only: compact ASCII keeps the ID property (and its undo copy) small
+    raw = json.dumps(data, separators=(",", ":"))
+    col[_PRESET_KEY] = raw
+    _PRESET_CACHE["data"] = _parse_presets(raw)
+    _PRESET_CACHE["raw"] = raw
 
 
 def _preset_items(self, context):
     if not context or not context.scene:
-        return [("NONE", "(no presets)", "No presets available")]
+        return _NO_PRESET_ITEMS
     data = _load_presets(context)
-    names = sorted(list(data.get("presets", {}).keys()))
+    names = tuple(sorted(data.get("presets", {}).keys()))
     if not names:
-        return [("NONE", "(no presets)", "No presets available")]
-    items = [("NONE", "(none)", "No preset")]
-    for n in names:
-        items.append((n, n, f"Preset: {n}"))
-    return items
+        return _NO_PRESET_ITEMS
+    # Blender needs the returned item strings kept alive: hold the list in the cache
+    if names != _PRESET_CACHE["names"]:
+        items = [("NONE", "(none)", "No preset")]
+        for n in names:
+            items.append((n, n, f"Preset: {n}"))
+        _PRESET_CACHE["names"] = names
+        _PRESET_CACHE["items"] = items
+    return _PRESET_CACHE["items"]
 
 
 # ============================================================
 # Star mesh building (triangle fan from center -> triangles)
 # ============================================================
 
+_OK = (True, "")
+
+
 def _validate(star_type: str, spikes: int, outer: float, inner: float, scale: float, thickness: float):
     if spikes < 3:
         return False, "Spikes must be >= 3"
@@ -88,7 +127,7 @@ def _validate(star_type: str, spikes: int, outer: float, inner: float, scale: fl
         return False, "Inner Radius must be smaller than Outer Radius"
     if star_type == "STAR_3D" and thickness < 0.0:
         return False, "Thickness must be >= 0"
-    return True, ""
+    return _OK
 
 
 def _make_name(pattern: str, spikes: int) -> str:
@@ -97,38 +136,99 @@ def _make_name(pattern: str, spikes: int) -> str:
     return name.strip() or f"Star_{s2}"
 
 
-def _build_star_bmesh(bm: bmesh.types.BMesh, spikes: int, outer_r: float, inner_r: float, rot_deg: float):
+@lru_cache(maxsize=32)
+def _unit_ring(spikes: int, rot_deg: float):
+    # unit cos / sin per ring vertex as separate float32 arrays; slider drags change radii only, so trig is cached
     count = spikes * 2
     step = (2.0 * math.pi) / count
-    rot = math.radians(rot_deg)
-
-    ring = []
-    for i in range(count):
-        ang = i * step + rot
-        r = outer_r if (i % 2 == 0) else inner_r
-        ring.append(bm.verts.new((math.cos(ang) * r, math.sin(ang) * r, 0.0)))
-
-    center = bm.verts.new((0.0, 0.0, 0.0))
-    bm.verts.ensure_lookup_table()
-
-    # Triangle fan from center
-    for i in range(count):
-        v0 = ring[i]
-        v1 = ring[(i + 1) % count]
-        bm.faces.new((center, v0, v1))
-
-    bm.faces.ensure_lookup_table()
-    bmesh.ops.recalc_face_normals(bm, faces=bm.faces)
-
-
-def _extrude_thickness(bm: bmesh.types.BMesh, thickness: float):
+    ang = np.arange(count) * step + math.radians(rot_deg)
+    cos_a = np.cos(ang).astype(np.float32)
+    sin_a = np.sin(ang).astype(np.float32)
+    cos_a.setflags(write=False)  # shared between calls
+    sin_a.setflags(write=False)
+    return cos_a, sin_a
+
+
+@njit(cache=True)
+def _fill_ring(xs, ys, cos_a, sin_a, outer_r, inner_r):
+    # Compiled twin of the NumPy radius multiply below: scales the cached unit ring in one loop
+    for i in range(len(cos_a)):
+        r = inner_r if i & 1 else outer_r
+        xs[i] = cos_a[i] * r
+        ys[i] = sin_a[i] * r
+
+
+def _star_ring_coords(spikes: int, outer_r: float, inner_r: float, rot_deg: float):
+    # Alternating outer/inner ring as (xs, ys) float32; z is written straight into the co buffer
+    cos_a, sin_a = _unit_ring(spikes, rot_deg)
+    if _HAS_NUMBA:
+        xs = np.empty(len(cos_a), dtype=np.float32)
+        ys = np.empty(len(cos_a), dtype=np.float32)
+        _fill_ring(xs, ys, cos_a, sin_a, outer_r, inner_r)
+        return xs, ys
+
+    r = np.empty(len(cos_a), dtype=np.float32)
+    r[0::2] = outer_r
+    r[1::2] = inner_r
+    return cos_a * r, sin_a * r
+
+
+def _star_mesh_data(xs: np.ndarray, ys: np.ndarray, thickness: float):
+    # Flat arrays for foreach_set: co (V, 3) float32, loop_start / loop_total / loop vertex_index int32.
+    # Flat: ring + center, triangle fan facing +Z.
+    # Prism (thickness > 0): bottom fan facing -Z, top ring + center at z = thickness
+    # with a fan facing +Z, and one outward quad per ring edge.
+    count = len(xs)
+    i = np.arange(count, dtype=np.int32)
+    nxt = np.roll(i, -1)
+    center = np.full(count, count, dtype=np.int32)
     if thickness <= 0.0:
-        return
-    bm.faces.ensure_lookup_table()
-    res = bmesh.ops.extrude_face_region(bm, geom=list(bm.faces))
-    extruded_verts = [e for e in res["geom"] if isinstance(e, bmesh.types.BMVert)]
-    bmesh.ops.translate(bm, verts=extruded_verts, vec=(0.0, 0.0, thickness))
-    bmesh.ops.recalc_face_normals(bm, faces=bm.faces)
+        co = np.zeros((count + 1, 3), dtype=np.float32)
+        co[:count, 0] = xs
+        co[:count, 1] = ys
+        loops = np.column_stack((center, i, nxt)).ravel()
+        loop_total = np.full(count, 3, dtype=np.int32)
+    else:
+        co = np.zeros((2 * count + 2, 3), dtype=np.float32)
+        co[:count, 0] = xs
+        co[:count, 1] = ys
+        co[count + 1:2 * count + 1, 0] = xs
+        co[count + 1:2 * count + 1, 1] = ys
+        co[count + 1:, 2] = thickness
+        t = count + 1  # first top ring vertex
+        tc = center + t  # top center
+        tris = np.concatenate((
+            np.column_stack((center, nxt, i)),
+            np.column_stack((tc, t + i, t + nxt)),
+        ))
+        quads = np.column_stack((i, nxt, t + nxt, t + i))
+        loops = np.concatenate((tris.ravel(), quads.ravel()))
+        loop_total = np.concatenate((np.full(2 * count, 3, dtype=np.int32), np.full(count, 4, dtype=np.int32)))
+    loop_start = np.zeros(len(loop_total), dtype=np.int32)
+    np.cumsum(loop_total[:-1], out=loop_start[1:])
+    return co, loop_start, loop_total, loops.astype(np.int32, copy=False)
+
+
+# MeshPolygon.loop_total is read-only from 4.0 (derived from loop_start)
+_SET_LOOP_TOTAL = bpy.app.version < (4, 0, 0)
+
+
+# Parameters of the last build (see _build_params), stored on the mesh datablock:
+# undo and file load restore them together with the geometry they describe
+_BUILD_PARAMS_KEY = "_star_build_params"
+
+
+def _build_params(star_type: str, spikes: int, outer: float, inner: float, scale: float, thickness: float, rot_deg: float) -> tuple:
+    # all floats so it round-trips through a float ID-property array
+    return (float(star_type == "STAR_3D"), float(spikes), outer, inner, scale, thickness, rot_deg)
+
+
+def _mesh_is_built(obj: bpy.types.Object, op) -> bool:
+    # True when obj's mesh was last built from op's current parameters
+    params = _build_params(
+        op.star_type, op.spikes, op.outer_radius, op.inner_radius, op.global_scale, op.thickness, op.rotation_deg,
+    )
+    return tuple(obj.data.get(_BUILD_PARAMS_KEY, ())) == params
 
 
 def rebuild_star_mesh(obj: bpy.types.Object, *, star_type: str, spikes: int, outer: float, inner: float, scale: float, thickness: float, rot_deg: float):
@@ -140,16 +240,22 @@ def rebuild_star_mesh(obj: bpy.types.Object, *, star_type: str, spikes: int, out
     inner_r = inner * scale
     thick = thickness * scale
 
-    bm = bmesh.new()
-    _build_star_bmesh(bm, spikes, outer_r, inner_r, rot_deg)
-    if star_type == "STAR_3D":
-        _extrude_thickness(bm, thick)
+    xs, ys = _star_ring_coords(spikes, outer_r, inner_r, rot_deg)
+    co, loop_start, loop_total, loop_verts = _star_mesh_data(xs, ys, thick if star_type == "STAR_3D" else 0.0)
 
+    # Topology is known up front: bulk buffer upload, no per-vertex Python tuples
     mesh = obj.data
     mesh.clear_geometry()
-    bm.to_mesh(mesh)
-    bm.free()
-    mesh.update()
+    mesh.vertices.add(len(co))
+    mesh.loops.add(len(loop_verts))
+    mesh.polygons.add(len(loop_start))
+    mesh.vertices.foreach_set("co", co.ravel())
+    mesh.loops.foreach_set("vertex_index", loop_verts)
+    mesh.polygons.foreach_set("loop_start", loop_start)
+    if _SET_LOOP_TOTAL:
+        mesh.polygons.foreach_set("loop_total", loop_total)
+    mesh.update(calc_edges=True)
+    mesh[_BUILD_PARAMS_KEY] = _build_params(star_type, spikes, outer, inner, scale, thickness, rot_deg)
 
 
 # ============================================================
@@ -316,8 +422,8 @@ class STAR_OT_save_preset_dialog(bpy.types.Operator):
             return {'CANCELLED'}
 
         op = obj.star_mesh_creator_obj
-        data = _load_presets(context)
-        presets = data.setdefault("presets", {})
+        data = dict(_load_presets(context))
+        presets = data["presets"] = dict(data.get("presets", {}))
         presets[name] = {
             "star_type": op.star_type,
             "spikes": int(op.spikes),
@@ -386,53 +492,58 @@ def _active_star_object(context):
     return None
 
 
-class _UIRect:
-    __slots__ = ("x", "y", "w", "h")
-
-    def __init__(self, x, y, w, h):
-        self.x, self.y, self.w, self.h = x, y, w, h
-
-    def contains(self, mx, my):
-        return (self.x <= mx <= self.x + self.w) and (self.y <= my <= self.y + self.h)
+def _contains(r, mx, my):
+    # r: (x, y, w, h) tuple
+    return r[0] <= mx <= r[0] + r[2] and r[1] <= my <= r[1] + r[3]
 
 
 def _clamp(v, a, b):
     return a if v < a else b if v > b else v
 
 
-def _draw_rect(x, y, w, h, color):
-    shader = gpu.shader.from_builtin('UNIFORM_COLOR')
-    verts = [(x, y), (x + w, y), (x + w, y + h), (x, y + h)]
-    indices = [(0, 1, 2), (2, 3, 0)]
-    batch = batch_for_shader(shader, 'TRIS', {"pos": verts}, indices=indices)
-    gpu.state.blend_set('ALPHA')
-    shader.bind()
-    shader.uniform_float("color", color)
-    batch.draw(shader)
-    gpu.state.blend_set('NONE')
+# Per-vertex color shader for the batched panel rects (created lazily: no GPU context at import)
+_RECT_SHADER = None
+
+
+def _rect_shader():
+    global _RECT_SHADER
+    if _RECT_SHADER is None:
+        _RECT_SHADER = gpu.shader.from_builtin('FLAT_COLOR')
+    return _RECT_SHADER
+
+
+# Last size we set per font id. Font 0 is shared with Blender's own UI,
+# so the tracker is reset at the start of every draw callback.
+_BLF_SIZE = {0: None}
+
+
+def _blf_size(font_id, size):
+    if _BLF_SIZE[font_id] != size:
+        blf.size(font_id, size)
+        _BLF_SIZE[font_id] = size
+
+
+def _reset_blf_size():
+    for font_id in _BLF_SIZE:
+        _BLF_SIZE[font_id] = None
 
 
 def _draw_text(x, y, text, size=12, color=(1, 1, 1, 1)):
     font_id = 0
     blf.position(font_id, x, y, 0)
-    blf.size(font_id, size)
+    _blf_size(font_id, size)
     blf.color(font_id, *color)
     blf.draw(font_id, text)
 
 
+@lru_cache(maxsize=128)
 def _text_dimensions(text: str, size: int):
+    # (w, h) per (text, size): button labels are measured again on every redraw
     font_id = 0
-    blf.size(font_id, size)
+    _blf_size(font_id, size)
     return blf.dimensions(font_id, text)
 
 
-def _draw_text_centered_in_rect(rect: _UIRect, text: str, size=11, color=(1, 1, 1, 1)):
-    tw, _th = _text_dimensions(text, size)
-    x = rect.x + (rect.w - tw) * 0.5
-    y = rect.y + (rect.h - size) * 0.5 + 2
-    _draw_text(x, y, text, size, color)
-
-
 class STAR_OT_pinned_editor(bpy.types.Operator):
     bl_idname = "star_mesh_creator.pinned_editor"
     bl_label = "Star Edit "
@@ -441,13 +552,14 @@ class STAR_OT_pinned_editor(bpy.types.Operator):
     # State
     _timer = None
     _dirty = False
-    _dirty_time = 0.0
+    _dirty_time = 0  # time.monotonic_ns() of the last change
     _updating = False
     _dragging = None
+    _drag_rect = None  # slider bar rect of _dragging, captured on press
     _needs_redraw = True
 
-    # Panel rect
-    _rect_panel = None
+    # Panel bounding box (x0, y0, x1, y1) for MOUSEMOVE gating
+    _panel_bbox = None
 
     # Layout
     pad = 10
@@ -463,6 +575,10 @@ class STAR_OT_pinned_editor(bpy.types.Operator):
     _rect_save = None
     _rect_close = None
 
+    # Cached layout (panel / slider / footer rects), keyed by is_3d
+    _layout = None
+    _layout_key = None
+
     # Slider rects
     _r_spikes = None
     _r_outer = None
@@ -470,19 +586,23 @@ class STAR_OT_pinned_editor(bpy.types.Operator):
     _r_scale = None
     _r_thick = None
 
+    # VIEW_3D areas to tag (the overlay draws in all of them); rescanned when the screen changes
+    _v3d_screen = None
+    _v3d_areas = ()
+
     # timer params
-    _timer_interval = 0.12  # slower = less interference
+    # One-shot debounce timer: exists only while a rebuild is pending and
+    # fires when _debounce_ns has passed since the latest change
+    _debounce_ns = 120_000_000  # 0.12s
 
-    def _ensure_timer(self, context):
-        if self._timer is None:
-            self._timer = context.window_manager.event_timer_add(self._timer_interval, window=context.window)
+    def _arm_timer(self, context):
+        self._remove_timer(context)
+        remaining_ns = self._dirty_time + self._debounce_ns - time.monotonic_ns()
+        self._timer = context.window_manager.event_timer_add(max(remaining_ns, 10_000_000) / 1e9, window=context.window)
 
-    def _stop_timer_if_idle(self, context):
-        # Stop timer if nothing to do
+    def _remove_timer(self, context):
         if self._timer is None:
             return
-        if self._dirty or self._dragging:
-            return
         try:
             context.window_manager.event_timer_remove(self._timer)
         except Exception:
@@ -493,21 +613,34 @@ class STAR_OT_pinned_editor(bpy.types.Operator):
         if not self._needs_redraw:
             return
         self._needs_redraw = False
-        for area in context.window.screen.areas:
-            if area.type == 'VIEW_3D':
+        if context.window.screen != self._v3d_screen:
+            self._cache_view3d_areas(context)
+        try:
+            for area in self._v3d_areas:
                 area.tag_redraw()
+        except ReferenceError:
+            # area was freed (screen layout edited); rescan once
+            self._cache_view3d_areas(context)
+            for area in self._v3d_areas:
+                area.tag_redraw()
+
+    def _cache_view3d_areas(self, context):
+        screen = context.window.screen
+        self._v3d_screen = screen
+        self._v3d_areas = tuple(a for a in screen.areas if a.type == 'VIEW_3D')
 
     def _set_dirty(self, context):
         self._dirty = True
-        self._dirty_time = time.time()
+        self._dirty_time = time.monotonic_ns()
         self._needs_redraw = True
-        self._ensure_timer(context)
+        if self._timer is None:
+            self._arm_timer(context)
 
     def _debounced_rebuild(self, context) -> bool:
         """Return True if a rebuild occurred."""
         if not self._dirty:
             return False
-        if (time.time() - self._dirty_time) < 0.12:
+        if (time.monotonic_ns() - self._dirty_time) < self._debounce_ns:
             return False
 
         obj = _active_star_object(context)
@@ -521,6 +654,8 @@ class STAR_OT_pinned_editor(bpy.types.Operator):
             return False
 
         op = obj.star_mesh_creator_obj
+        if _mesh_is_built(obj, op):
+            return False  # jitter / released on the value already built
         ok, _ = _validate(op.star_type, op.spikes, op.outer_radius, op.inner_radius, op.global_scale, op.thickness)
         if not ok:
             return False
@@ -543,25 +678,56 @@ class STAR_OT_pinned_editor(bpy.types.Operator):
         finally:
             self._updating = False
 
-    def _draw_slider_row(self, x0, y, label, value_str, rect_attr, t_norm):
+    # Per-frame draw lists: all rects go out as one batch, then text on top
+
+    def _begin_frame(self):
+        self._frame_verts = []
+        self._frame_colors = []
+        self._frame_indices = []
+        self._frame_texts = []
+
+    def _queue_rect(self, x, y, w, h, color):
+        i = len(self._frame_verts)
+        self._frame_verts += ((x, y), (x + w, y), (x + w, y + h), (x, y + h))
+        self._frame_colors += (color, color, color, color)
+        self._frame_indices += ((i, i + 1, i + 2), (i + 2, i + 3, i))
+
+    def _queue_text(self, x, y, text, size=12, color=(1, 1, 1, 1)):
+        self._frame_texts.append((x, y, text, size, color))
+
+    def _queue_text_centered_in_rect(self, rect, text: str, size=11, color=(1, 1, 1, 1)):
+        rx, ry, rw, rh = rect
+        tw, _th = _text_dimensions(text, size)
+        x = rx + (rw - tw) * 0.5
+        y = ry + (rh - size) * 0.5 + 2
+        self._queue_text(x, y, text, size, color)
+
+    def _end_frame(self):
+        if self._frame_verts:
+            shader = _rect_shader()
+            batch = batch_for_shader(
+                shader, 'TRIS', {"pos": self._frame_verts, "color": self._frame_colors}, indices=self._frame_indices
+            )
+            gpu.state.blend_set('ALPHA')
+            shader.bind()
+            batch.draw(shader)
+            gpu.state.blend_set('NONE')
+        for x, y, text, size, color in self._frame_texts:
+            _draw_text(x, y, text, size, color)
+
+    def _draw_slider_row(self, x0, y, bar, label, value_str, t_norm):
         label_x = x0 + 12
-        slider_x = x0 + 150
         value_x = x0 + self.w - 58
 
-        _draw_text(label_x, y + 4, label, 11, (1, 1, 1, 1))
-
-        bar = _UIRect(slider_x, y + 6, self.slider_w, self.slider_h)
-        setattr(self, rect_attr, bar)
+        self._queue_text(label_x, y + 4, label, 11, (1, 1, 1, 1))
 
-        _draw_rect(bar.x, bar.y, bar.w, bar.h, (0.18, 0.18, 0.18, 0.95))
+        bx, by, bw, bh = bar
+        self._queue_rect(bx, by, bw, bh, (0.18, 0.18, 0.18, 0.95))
         t = _clamp(t_norm, 0.0, 1.0)
-        _draw_rect(bar.x, bar.y, bar.w * t, bar.h, (0.35, 0.55, 0.95, 0.95))
-        _draw_text(value_x, y + 4, value_str, 11, (0.95, 0.95, 0.95, 1))
+        self._queue_rect(bx, by, bw * t, bh, (0.35, 0.55, 0.95, 0.95))
+        self._queue_text(value_x, y + 4, value_str, 11, (0.95, 0.95, 0.95, 1))
 
-    def _compute_panel_height(self, context):
-        obj = _active_star_object(context)
-        has_target = bool(obj)
-        is_3d = has_target and (obj.star_mesh_creator_obj.star_type == "STAR_3D")
+    def _compute_panel_height(self, is_3d: bool):
         rows = 4 + (1 if is_3d else 0)
         panel_h = (
             self.pad * 2
@@ -572,77 +738,99 @@ class STAR_OT_pinned_editor(bpy.types.Operator):
         )
         return panel_h
 
-    def _draw(self, context):
-        panel_h = self._compute_panel_height(context)
+    def _get_layout(self, is_3d: bool):
+        # Panel geometry only depends on the row count: rebuild when 2D/3D toggles
+        if self._layout is not None and self._layout_key == is_3d:
+            return self._layout
+
+        panel_h = self._compute_panel_height(is_3d)
         x0 = self.pad
         y0 = self.pad
 
-        # Store panel rect for fast event gating
-        self._rect_panel = _UIRect(x0, y0, self.w, panel_h)
+        # Slider rows top-down: (y, rect attr, bar rect)
+        y = y0 + panel_h - 44 - self.line_h - self.row_h
+        rows = []
+        for attr in ("_r_spikes", "_r_outer", "_r_inner", "_r_scale") + (("_r_thick",) if is_3d else ()):
+            rows.append((y, attr, (x0 + 150, y + 6, self.slider_w, self.slider_h)))
+            y -= self.row_h
+
+        # Footer buttons (side-by-side)
+        footer_y = y0 + 10
+        btn_h = 22
+        gap = 10
+        btn_w = int((self.w - 12 * 2 - gap) / 2)
+
+        self._layout_key = is_3d
+        self._layout = {
+            "panel_h": panel_h,
+            "panel_bbox": (x0, y0, x0 + self.w, y0 + panel_h),
+            "rows": rows,
+            "save": (x0 + 12, footer_y, btn_w, btn_h),
+            "close": (x0 + 12 + btn_w + gap, footer_y, btn_w, btn_h),
+        }
+        return self._layout
 
+    def _draw(self, context):
         obj = _active_star_object(context)
         has_target = bool(obj)
         op = obj.star_mesh_creator_obj if has_target else None
         is_3d = has_target and (op.star_type == "STAR_3D")
 
-        _draw_rect(x0, y0, self.w, panel_h, (0.08, 0.08, 0.08, 0.78))
-        _draw_text(x0 + 12, y0 + panel_h - 20, "Star Edit (Pinned)", 13, (1, 1, 1, 1))
+        layout = self._get_layout(is_3d)
+        panel_h = layout["panel_h"]
+        x0 = self.pad
+        y0 = self.pad
+
+        # Store panel bbox for fast event gating
+        self._panel_bbox = layout["panel_bbox"]
+
+        self._queue_rect(x0, y0, self.w, panel_h, (0.08, 0.08, 0.08, 0.78))
+        self._queue_text(x0 + 12, y0 + panel_h - 20, "Star Edit (Pinned)", 13, (1, 1, 1, 1))
 
         target_txt = obj.name if has_target else "(No Star Selected)"
-        _draw_text(x0 + 12, y0 + panel_h - 44, f"Target: {target_txt}", 11, (0.9, 0.9, 0.9, 1))
+        self._queue_text(x0 + 12, y0 + panel_h - 44, f"Target: {target_txt}", 11, (0.9, 0.9, 0.9, 1))
 
         if not has_target:
-            _draw_text(x0 + 12, y0 + panel_h - 64, "Select a Star created by this addon.", 11, (1, 0.8, 0.2, 1))
+            self._queue_text(x0 + 12, y0 + panel_h - 64, "Select a Star created by this addon.", 11, (1, 0.8, 0.2, 1))
             self._r_spikes = self._r_outer = self._r_inner = self._r_scale = self._r_thick = None
             self._rect_save = self._rect_close = None
             return
 
         ok, msg = _validate(op.star_type, op.spikes, op.outer_radius, op.inner_radius, op.global_scale, op.thickness)
         if not ok:
-            _draw_text(x0 + 12, y0 + panel_h - 64, f"Invalid: {msg}", 11, (1, 0.35, 0.35, 1))
-
-        y = y0 + panel_h - 44 - self.line_h - self.row_h
+            self._queue_text(x0 + 12, y0 + panel_h - 64, f"Invalid: {msg}", 11, (1, 0.35, 0.35, 1))
 
         spikes_ui_max = 64
         spikes_t = (op.spikes - 3) / (spikes_ui_max - 3) if spikes_ui_max > 3 else 0.0
-        self._draw_slider_row(x0, y, "Spikes", str(op.spikes), "_r_spikes", spikes_t)
-        y -= self.row_h
-
-        outer_t = (op.outer_radius - 0.01) / (10.0 - 0.01)
-        self._draw_slider_row(x0, y, "Outer Radius", f"{op.outer_radius:.3f}", "_r_outer", outer_t)
-        y -= self.row_h
-
-        inner_t = (op.inner_radius - 0.01) / (9.5 - 0.01)
-        self._draw_slider_row(x0, y, "Inner Radius", f"{op.inner_radius:.3f}", "_r_inner", inner_t)
-        y -= self.row_h
-
-        scale_t = (op.global_scale - 0.01) / (10.0 - 0.01)
-        self._draw_slider_row(x0, y, "Global Scale", f"{op.global_scale:.3f}", "_r_scale", scale_t)
-        y -= self.row_h
-
+        values = [
+            ("Spikes", str(op.spikes), spikes_t),
+            ("Outer Radius", f"{op.outer_radius:.3f}", (op.outer_radius - 0.01) / (10.0 - 0.01)),
+            ("Inner Radius", f"{op.inner_radius:.3f}", (op.inner_radius - 0.01) / (9.5 - 0.01)),
+            ("Global Scale", f"{op.global_scale:.3f}", (op.global_scale - 0.01) / (10.0 - 0.01)),
+        ]
         if is_3d:
-            thick_t = (op.thickness - 0.0) / (5.0 - 0.0)
-            self._draw_slider_row(x0, y, "Thickness", f"{op.thickness:.3f}", "_r_thick", thick_t)
+            values.append(("Thickness", f"{op.thickness:.3f}", (op.thickness - 0.0) / (5.0 - 0.0)))
         else:
             self._r_thick = None
 
-        # Footer buttons (side-by-side)
-        footer_y = y0 + 10
-        btn_h = 22
-        gap = 10
-        btn_w = int((self.w - 12 * 2 - gap) / 2)
+        for (y, attr, bar), (label, value_str, t) in zip(layout["rows"], values):
+            setattr(self, attr, bar)
+            self._draw_slider_row(x0, y, bar, label, value_str, t)
 
-        self._rect_save = _UIRect(x0 + 12, footer_y, btn_w, btn_h)
-        self._rect_close = _UIRect(x0 + 12 + btn_w + gap, footer_y, btn_w, btn_h)
+        self._rect_save = layout["save"]
+        self._rect_close = layout["close"]
 
-        _draw_rect(self._rect_save.x, self._rect_save.y, self._rect_save.w, self._rect_save.h, (0.25, 0.25, 0.25, 0.95))
-        _draw_text_centered_in_rect(self._rect_save, "Save Preset", 11, (1, 1, 1, 1))
+        self._queue_rect(*self._rect_save, (0.25, 0.25, 0.25, 0.95))
+        self._queue_text_centered_in_rect(self._rect_save, "Save Preset", 11, (1, 1, 1, 1))
 
-        _draw_rect(self._rect_close.x, self._rect_close.y, self._rect_close.w, self._rect_close.h, (0.25, 0.25, 0.25, 0.95))
-        _draw_text_centered_in_rect(self._rect_close, "Close", 11, (1, 1, 1, 1))
+        self._queue_rect(*self._rect_close, (0.25, 0.25, 0.25, 0.95))
+        self._queue_text_centered_in_rect(self._rect_close, "Close", 11, (1, 1, 1, 1))
 
     def _draw_callback(self, _self, context):
+        _reset_blf_size()
+        self._begin_frame()
         self._draw(context)
+        self._end_frame()
 
     def _set_slider_value(self, context, key, t_norm):
         obj = _active_star_object(context)
@@ -684,6 +872,7 @@ class STAR_OT_pinned_editor(bpy.types.Operator):
 
         _EDITOR_RUNNING = True
         self._needs_redraw = True
+        self._cache_view3d_areas(context)
 
         _EDITOR_DRAW_HANDLE = bpy.types.SpaceView3D.draw_handler_add(
             self._draw_callback, (self, context), 'WINDOW', 'POST_PIXEL'
@@ -704,8 +893,11 @@ class STAR_OT_pinned_editor(bpy.types.Operator):
             did = self._debounced_rebuild(context)
             if did:
                 self._needs_redraw = True
-            # If we aren't dirty or dragging, stop timer (reduces interference)
-            self._stop_timer_if_idle(context)
+            if self._dirty:
+                # changed again since the timer was armed: fire at the new deadline
+                self._arm_timer(context)
+            else:
+                self._remove_timer(context)
             self._tag_redraw_view3d(context)
             return {'PASS_THROUGH'}
 
@@ -716,8 +908,11 @@ class STAR_OT_pinned_editor(bpy.types.Operator):
 
             if self._dragging is None:
                 # If we haven't drawn yet, do not block anything
-                if self._rect_panel and (not self._rect_panel.contains(mx, my)):
-                    return {'PASS_THROUGH'}
+                bbox = self._panel_bbox
+                if bbox is not None:
+                    bx0, by0, bx1, by1 = bbox
+                    if not (bx0 <= mx <= bx1 and by0 <= my <= by1):
+                        return {'PASS_THROUGH'}
 
         if event.type == 'LEFTMOUSE':
             mx = event.mouse_region_x
@@ -725,7 +920,7 @@ class STAR_OT_pinned_editor(bpy.types.Operator):
 
             if event.value == 'PRESS':
                 # inside panel only
-                if self._rect_save and self._rect_save.contains(mx, my):
+                if self._rect_save and _contains(self._rect_save, mx, my):
                     try:
                         bpy.ops.star_mesh_creator.save_preset_dialog('INVOKE_DEFAULT')
                     except Exception:
@@ -735,7 +930,7 @@ class STAR_OT_pinned_editor(bpy.types.Operator):
                     self._tag_redraw_view3d(context)
                     return {'RUNNING_MODAL'}
 
-                if self._rect_close and self._rect_close.contains(mx, my):
+                if self._rect_close and _contains(self._rect_close, mx, my):
                     self._finish(context)
                     return {'CANCELLED'}
 
@@ -747,10 +942,10 @@ class STAR_OT_pinned_editor(bpy.types.Operator):
                     ("scale", self._r_scale),
                     ("thick", self._r_thick),
                 ):
-                    if rect and rect.contains(mx, my):
+                    if rect and _contains(rect, mx, my):
                         self._dragging = key
-                        self._ensure_timer(context)  # dragging needs timer for debounced rebuild
-                        t = (mx - rect.x) / rect.w if rect.w > 0 else 0.0
+                        self._drag_rect = rect
+                        t = (mx - rect[0]) / rect[2] if rect[2] > 0 else 0.0
                         self._set_slider_value(context, key, t)
                         self._needs_redraw = True
                         self._tag_redraw_view3d(context)
@@ -759,23 +954,16 @@ class STAR_OT_pinned_editor(bpy.types.Operator):
             elif event.value == 'RELEASE':
                 if self._dragging is not None:
                     self._dragging = None
-                    # keep timer only if still dirty; otherwise stop soon
-                    self._stop_timer_if_idle(context)
+                    self._drag_rect = None
                     self._needs_redraw = True
                     self._tag_redraw_view3d(context)
                 return {'RUNNING_MODAL'}
 
         if event.type == 'MOUSEMOVE' and self._dragging:
-            rect = {
-                "spikes": self._r_spikes,
-                "outer": self._r_outer,
-                "inner": self._r_inner,
-                "scale": self._r_scale,
-                "thick": self._r_thick,
-            }.get(self._dragging)
+            rect = self._drag_rect
             if rect:
                 mx = event.mouse_region_x
-                t = (mx - rect.x) / rect.w if rect.w > 0 else 0.0
+                t = (mx - rect[0]) / rect[2] if rect[2] > 0 else 0.0
                 self._set_slider_value(context, self._dragging, t)
                 self._needs_redraw = True
                 self._tag_redraw_view3d(context)
@@ -787,12 +975,7 @@ class STAR_OT_pinned_editor(bpy.types.Operator):
         global _EDITOR_RUNNING, _EDITOR_DRAW_HANDLE
 
         # Remove timer if running
-        if self._timer is not None:
-            try:
-                context.window_manager.event_timer_remove(self._timer)
-            except Exception:
-                pass
-            self._timer = None
+        self._remove_timer(context)
 
         # Remove draw handler
         try:
@@ -828,6 +1011,9 @@ def register():
         bpy.utils.register_class(c)
     bpy.types.Object.star_mesh_creator_obj = PointerProperty(type=STAR_ObjProps)
     bpy.types.Scene.star_mesh_creator = PointerProperty(type=STAR_SceneProps)
+    if _HAS_NUMBA:
+        # compile (or load from cache) the ring kernel now rather than on the first drag
+        _star_ring_coords(5, 1.0, 0.5, 0.0)
 
 
 def unregister():
@@ -840,6 +1026,10 @@ def unregister():
             pass
         _EDITOR_DRAW_HANDLE = None
 
+    _unit_ring.cache_clear()
+    _PRESET_CACHE.update(raw=None, data=None, names=None, items=None)
+    _text_dimensions.cache_clear()
+
     del bpy.types.Scene.star_mesh_creator
     del bpy.types.Object.star_mesh_creator_obj
     for c in reversed(classes):